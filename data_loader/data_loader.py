@@ -3,6 +3,7 @@ Data Loader for TFT Set 16
 Loads and parses all game data from JSON files
 """
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 from .data_models import (
@@ -104,9 +105,12 @@ class TFTDataLoader:
             )
             
             # Create champion
+            # Intern ids/names: they are used as dict keys and compared all
+            # over the simulator, and interned strings equality-check by
+            # pointer before falling back to a character compare.
             champion = Champion(
-                champion_id=champ_data.get("apiName", ""),
-                name=champ_data.get("name", ""),
+                champion_id=sys.intern(champ_data.get("apiName", "")),
+                name=sys.intern(champ_data.get("name", "")),
                 cost=champ_data.get("cost", 1),
                 traits=champ_data.get("traits", []),
                 stats=stats,
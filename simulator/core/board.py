@@ -31,7 +31,18 @@ class Board:
         
         # Grid storage: position -> Champion or None
         self.grid: Dict[Tuple[int, int], Optional[Champion]] = {}
-        
+
+        # Reverse index: id(champion) -> position, kept in sync by
+        # place/remove/move/swap/clear so find_champion is O(1).
+        self._pos: Dict[int, Tuple[int, int]] = {}
+
+        # Monotonic mutation counter, bumped by every successful
+        # place/remove/move/swap/clear.  Lets get_all_champions (and any
+        # external consumer) memoize per board state.
+        self.revision: int = 0
+        self._champions_cache: List[Champion] = []
+        self._champions_cache_rev: int = -1
+
         # Initialize empty grid
         for row in range(rows):
             for col in range(cols):
@@ -79,8 +90,10 @@ class Board:
         
         # Place at new position
         self.grid[(row, col)] = champion
+        self._pos[id(champion)] = (row, col)
         champion.position = (row, col)
-        
+        self.revision += 1
+
         return True
     
     def remove(self, row: int, col: int) -> Optional[Champion]:
@@ -100,8 +113,10 @@ class Board:
         champion = self.grid.get((row, col))
         if champion:
             self.grid[(row, col)] = None
+            self._pos.pop(id(champion), None)
             champion.position = None
-        
+            self.revision += 1
+
         return champion
     
     def move(self, from_row: int, from_col: int, to_row: int, to_col: int) -> bool:
@@ -130,8 +145,10 @@ class Board:
         # Move champion
         self.grid[(from_row, from_col)] = None
         self.grid[(to_row, to_col)] = champion
+        self._pos[id(champion)] = (to_row, to_col)
         champion.position = (to_row, to_col)
-        
+        self.revision += 1
+
         return True
     
     def swap(self, row1: int, col1: int, row2: int, col2: int) -> bool:
@@ -156,19 +173,35 @@ class Board:
         self.grid[(row2, col2)] = champ1
         
         if champ1:
+            self._pos[id(champ1)] = (row2, col2)
             champ1.position = (row2, col2)
         if champ2:
+            self._pos[id(champ2)] = (row1, col1)
             champ2.position = (row1, col1)
-        
+        self.revision += 1
+
         return True
     
     def get_all_champions(self) -> List[Champion]:
-        """Get list of all champions on board."""
-        return [champ for champ in self.grid.values() if champ is not None]
+        """
+        Get list of all champions on board (row-major order).
+
+        Memoized against the board revision: repeat calls between
+        mutations return the same list object, so treat it as read-only
+        (copy before mutating).
+        """
+        if self._champions_cache_rev != self.revision:
+            self._champions_cache = [
+                champ for champ in self.grid.values() if champ is not None
+            ]
+            self._champions_cache_rev = self.revision
+        return self._champions_cache
     
     def count_champions(self) -> int:
         """Count total champions on board."""
-        return len(self.get_all_champions())
+        # The reverse index has exactly one entry per placed champion,
+        # so its size is the occupancy count — no grid scan needed.
+        return len(self._pos)
     
     def clear(self):
         """Remove all champions from board."""
@@ -177,6 +210,8 @@ class Board:
             if champion:
                 champion.position = None
             self.grid[pos] = None
+        self._pos.clear()
+        self.revision += 1
     
     def find_champion(self, champion: Champion) -> Optional[Tuple[int, int]]:
         """
@@ -188,10 +223,7 @@ class Board:
         Returns:
             (row, col) tuple or None if not found
         """
-        for (row, col), champ in self.grid.items():
-            if champ == champion:
-                return (row, col)
-        return None
+        return self._pos.get(id(champion))
     
     def get_empty_positions(self) -> List[Tuple[int, int]]:
         """Get list of all empty positions."""
@@ -9,17 +9,25 @@ from dataclasses import dataclass, field
 
 from data_loader.data_models import Champion as ChampionData
 
+# Star multipliers (HP and AD) indexed by star level; index 0 unused.
+# 1.8x per star upgrade — see _update_base_stats for the sourcing.
+_STAR_MULT = (1.0, 1.0, 1.8, 3.24, 5.832)
 
-@dataclass
+
+@dataclass(slots=True)
 class Champion:
     """
     Lightweight champion instance for TFT simulation.
-    
+
     This class represents a champion ON THE BOARD or BENCH, not the
     champion template. It tracks current stats, items, and state.
-    
+
     The actual champion data (base stats, ability, traits) comes from
     the TFTDataLoader and is stored in the `data` field.
+
+    Uses ``slots=True`` so instances carry no per-object ``__dict__``:
+    champions are the hottest objects in combat simulation, and slotted
+    attribute access keeps them compact and cache-friendly.
     """
     
     data: ChampionData
@@ -54,6 +62,20 @@ class Champion:
     is_alive: bool = True
     is_stunned: bool = False
     is_channeling: bool = False
+
+    # Augment-driven combat modifiers (slotted so augment hooks can set
+    # them on instances; see simulator/env/augment_effects/)
+    _shield: float = 0.0
+    """Flat HP shield granted before combat (e.g. Exiles II)."""
+    _fires_missiles: bool = False
+    """Artillery Barrage flag: continuous missile barrage enabled."""
+    _bonus_attack_range: int = 0
+    """Extra range granted before combat (e.g. Artillery Barrage).
+
+    Kept separate from attack_range so passives reset a plain counter
+    instead of restoring the base stat from data each combat; readers
+    should use attack_range + _bonus_attack_range for effective range.
+    """
     
     def __post_init__(self):
         """Initialize combat stats from base data."""
@@ -73,8 +95,7 @@ class Champion:
         
         Source: Official TFT scaling, all champions can reach 4-star.
         """
-        star_multipliers = {1: 1.0, 2: 1.8, 3: 3.24, 4: 5.832}
-        multiplier = star_multipliers.get(self.stars, 1.0)
+        multiplier = _STAR_MULT[self.stars] if self.stars < len(_STAR_MULT) else 1.0
         
         # HP
         base_hp = self.data.stats.hp or 500
@@ -6,21 +6,47 @@ Manages a single player's state including:
 - Units (board, bench, shop)
 - Actions (buy, sell, move, level up, refresh)
 """
-from typing import List, Optional, Dict, Tuple
+from typing import Any, List, Optional, Dict, Tuple
 from simulator.core.board import Board
 from simulator.core.champion import Champion, create_champion
 from simulator.core.pool import ChampionPool
 from simulator.config import TFTConfig
 from data_loader import TFTDataLoader
+from data_loader.data_models import Champion as ChampionData
+# Upward import into the env layer; augment_effects never imports this
+# module at runtime, so this is cycle-free and saves re-running the
+# import statement inside select_augment.
+from simulator.env.augment_effects import apply_augment_hook
+from simulator.env.augment_effects.registry import _HOOK_TABLE, HookEvent
+
+# Pool copies represented by a champion at each star level (index 0
+# unused): a 2-star is 3 merged copies, a 3-star 9, a 4-star 27.
+_COPIES_FOR_STARS = (0, 1, 3, 9, 27)
 
 
 class Player:
     """
     Represents one player in TFT.
-    
+
     Manages player state and provides methods for all player actions.
+
+    Uses __slots__ (no per-instance __dict__): player attributes are read
+    millions of times across a training run, and slotted access is both
+    faster and more memory-dense. Any new attribute must be added here.
     """
-    
+
+    __slots__ = (
+        "player_id", "pool", "config", "data_loader",
+        "gold", "health", "level", "xp", "free_rerolls",
+        "board", "bench", "shop", "shop_data", "item_bench",
+        "is_alive", "placement",
+        "gold_spent", "total_damage_dealt", "total_damage_taken",
+        "rounds_survived", "win_streak", "loss_streak",
+        "active_traits", "selected_augments",
+        "_combat_team_snapshot", "_units_by_name", "_units_revision",
+        "_passive_plan", "_stage_start_plan", "_passive_memo",
+    )
+
     def __init__(
         self,
         player_id: int,
@@ -53,6 +79,9 @@ class Player:
         self.board = Board()
         self.bench: List[Optional[Champion]] = [None] * config.bench_size
         self.shop: List[Optional[str]] = [None] * config.shop_size
+        # Resolved ChampionData for each shop slot, kept in parallel with
+        # self.shop so buys don't re-resolve ids through the data loader
+        self.shop_data: List[Optional[ChampionData]] = [None] * config.shop_size
         
         # Items: 10-slot item bench holding component IDs (strings)
         self.item_bench: List[Optional[str]] = [None] * 20
@@ -76,6 +105,32 @@ class Player:
 
         # Augments (Phase 4+)
         self.selected_augments: List = []  # List[Augment]
+
+        # Pre-resolved (hook_fn, effects) pairs for every selected augment
+        # with a passive / on_stage_start hook, built in select_augment.
+        # Stored as tuples — they are extended at most a few times per
+        # game but iterated every combat/stage, so the iteration side
+        # gets the immutable fast path and accidental mutation is loud.
+        self._passive_plan: Tuple = ()
+        self._stage_start_plan: Tuple = ()
+
+        # Roster index: champion name -> owned Champion instances (bench
+        # and board). Maintained by _register_unit/_unregister_unit so
+        # name-scoped effects (e.g. Artillery Barrage finding Rumbles)
+        # don't have to scan all 37 slots
+        self._units_by_name: Dict[str, List[Champion]] = {}
+
+        # Roster mutation counter (bumped with the name index) and a
+        # scratch dict where passives memoize their last application,
+        # keyed by augment_id.  Together with board.revision this lets a
+        # passive skip its work when nothing it reads has changed.
+        self._units_revision: int = 0
+        self._passive_memo: Dict[str, Any] = {}
+
+        # Board team captured at end of planning; boards don't change
+        # between end_planning_phase and combat, so the PvP phase reads
+        # this instead of re-walking the board grid per matchup
+        self._combat_team_snapshot: List[Champion] = []
     
     # ===== Economy Actions =====
     
@@ -198,6 +253,12 @@ class Player:
             shop_size=self.config.shop_size,
             shop_odds=self.config.shop_odds
         )
+        # Resolve champion data once per shop generation instead of per buy
+        get_by_id = self.data_loader.get_champion_by_id
+        self.shop_data = [
+            get_by_id(champion_id) if champion_id else None
+            for champion_id in self.shop
+        ]
     
     def buy_champion_from_shop(self, shop_index: int) -> bool:
         """
@@ -216,9 +277,9 @@ class Player:
         champion_id = self.shop[shop_index]
         if champion_id is None:
             return False
-        
-        # Get champion data
-        champion_data = self.data_loader.get_champion_by_id(champion_id)
+
+        # Champion data was resolved at shop-generation time
+        champion_data = self.shop_data[shop_index]
         if not champion_data:
             return False
         
@@ -250,7 +311,8 @@ class Player:
         
         # Remove from shop
         self.shop[shop_index] = None
-        
+        self.shop_data[shop_index] = None
+
         return True
     
     def _add_to_bench(self, champion: Champion) -> bool:
@@ -274,8 +336,25 @@ class Player:
         for i, slot in enumerate(self.bench):
             if slot is None:
                 self.bench[i] = champion
+                self._register_unit(champion)
                 return True
         return False
+
+    def _register_unit(self, champion: Champion):
+        """Add champion to the name index when it joins the roster."""
+        self._units_by_name.setdefault(champion.name, []).append(champion)
+        self._units_revision += 1
+
+    def _unregister_unit(self, champion: Champion):
+        """Drop champion from the name index when it leaves the roster."""
+        units = self._units_by_name.get(champion.name)
+        if units is not None:
+            try:
+                units.remove(champion)
+            except ValueError:
+                pass
+            else:
+                self._units_revision += 1
     
     def _check_for_upgrade(self, new_champion: Champion) -> bool:
         """
@@ -314,6 +393,8 @@ class Player:
     
     def _remove_champion_from_bench_or_board(self, champion: Champion):
         """Remove champion from wherever it is."""
+        self._unregister_unit(champion)
+
         # Try bench
         for i, champ in enumerate(self.bench):
             if champ == champion:
@@ -420,14 +501,16 @@ class Player:
             champion = self.board.remove(row, col)
             if not champion:
                 return False
-        
+
+        self._unregister_unit(champion)
         return self._sell_champion(champion)
     
     def _sell_champion(self, champion: Champion) -> bool:
         """Internal method to sell a champion."""
         # Return to pool (based on base champion, not upgraded)
-        for _ in range(3 ** (champion.stars - 1)):  # 1→1, 2→3, 3→9
-            self.pool.release(champion.data.champion_id)
+        self.pool.release_many(
+            champion.data.champion_id, _COPIES_FOR_STARS[champion.stars]  # 1→1, 2→3, 3→9
+        )
         
         # Give gold
         sell_value = champion.cost
@@ -459,9 +542,18 @@ class Player:
 
         Fires the augment's on_select hook immediately.
         """
-        from simulator.env.augment_effects import apply_augment_hook
         self.selected_augments.append(augment)
-        apply_augment_hook(self, augment, "on_select")
+
+        hooks = _HOOK_TABLE.get(augment.augment_id)
+        if hooks is not None:
+            passive = hooks[HookEvent.PASSIVE]
+            if passive is not None:
+                self._passive_plan += ((passive, augment.effects),)
+            stage_start = hooks[HookEvent.ON_STAGE_START]
+            if stage_start is not None:
+                self._stage_start_plan += ((stage_start, augment.effects),)
+
+        apply_augment_hook(self, augment, HookEvent.ON_SELECT)
 
     # ===== Traits =====
     
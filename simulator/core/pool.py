@@ -44,10 +44,16 @@ class ChampionPool:
         
         # Pool state: {champion_id: {cost: available_count}}
         self.pool: Dict[str, int] = {}
-        
+
         # Track total champions per tier
         self.tier_totals: Dict[int, int] = defaultdict(int)
-        
+
+        # Static index: cost -> list of champion IDs at that cost.
+        # Built once at init; champion costs never change mid-game, so
+        # callers can filter this instead of re-deriving cost via
+        # get_champion_by_id per pool entry.
+        self.ids_by_cost: Dict[int, List[str]] = defaultdict(list)
+
         self._initialize_pool()
     
     def _initialize_pool(self):
@@ -66,6 +72,7 @@ class ChampionPool:
             # Add to pool
             self.pool[champion_id] = num_copies
             self.tier_totals[cost] += num_copies
+            self.ids_by_cost[cost].append(champion_id)
     
     def get_available(self, champion_id: str) -> int:
         """
@@ -130,8 +137,39 @@ class ChampionPool:
             self.pool[champion_id] += 1
             self.tier_totals[champion.cost] += 1
             return True
-        
+
         return False
+
+    def release_many(self, champion_id: str, count: int) -> int:
+        """
+        Release several copies of a champion back to the pool at once.
+
+        One data-loader lookup and one capped counter add instead of
+        `count` release() calls (e.g. selling a 3-star returns 9 copies).
+
+        Args:
+            champion_id: Champion API ID
+            count: Number of copies to return
+
+        Returns:
+            Number of copies actually returned (0 if champion not found,
+            fewer than count if the pool cap is hit)
+        """
+        if count <= 0 or champion_id not in self.pool:
+            return 0
+
+        champion = self.data_loader.get_champion_by_id(champion_id)
+        if not champion:
+            return 0
+
+        max_copies = self.pool_size_config.get(champion.cost, 10)
+        returned = min(count, max_copies - self.pool[champion_id])
+        if returned <= 0:
+            return 0
+
+        self.pool[champion_id] += returned
+        self.tier_totals[champion.cost] += returned
+        return returned
     
     def sample_shop(self, level: int, shop_size: int = 5, shop_odds: Optional[Dict[int, List[float]]] = None) -> List[str]:
         """
@@ -179,18 +217,20 @@ class ChampionPool:
                 k=1
             )[0]
             
-            # Get all available champions of this cost
+            # Get all available champions of this cost via the cost index —
+            # avoids rescanning the whole pool (with a data-loader lookup
+            # per champion) for every shop slot
             available_champions = [
-                champ_id for champ_id, count in self.pool.items()
-                if count > 0 and self.data_loader.get_champion_by_id(champ_id).cost == cost
+                champ_id for champ_id in self.ids_by_cost[cost]
+                if self.pool[champ_id] > 0
             ]
-            
+
             # If no champions available at this cost, try next highest
             while not available_champions and cost > 1:
                 cost -= 1
                 available_champions = [
-                    champ_id for champ_id, count in self.pool.items()
-                    if count > 0 and self.data_loader.get_champion_by_id(champ_id).cost == cost
+                    champ_id for champ_id in self.ids_by_cost[cost]
+                    if self.pool[champ_id] > 0
                 ]
             
             # Sample a random champion from available
@@ -223,5 +263,6 @@ class ChampionPool:
         """Reset the pool to initial state."""
         self.pool.clear()
         self.tier_totals.clear()
+        self.ids_by_cost.clear()
         self._initialize_pool()
     
@@ -18,43 +18,47 @@ class CombatSimulator:
     Phase 1 MVP uses statistical approximation for speed.
     This allows fast training while capturing core dynamics.
     """
-    
+
+    __slots__ = ("config", "_resolve")
+
     def __init__(self, config: TFTConfig):
         """
         Initialize combat simulator.
-        
+
         Args:
             config: Game configuration
         """
         self.config = config
-    
+
+        # Combat mode is fixed for the simulator's lifetime, so bind the
+        # resolver once instead of string-comparing combat_mode per combat.
+        # TODO: Phase 2 "simplified" / Phase 4 "full" get their own entries
+        # here once implemented.
+        self._resolve = {
+            "statistical": self._statistical_combat,
+            "simplified": self._statistical_combat,
+        }.get(config.combat_mode, self._statistical_combat)
+
     def resolve_combat(
-        self, 
-        team1: List[Champion], 
+        self,
+        team1: List[Champion],
         team2: List[Champion],
         round_number: int = 1
     ) -> Tuple[int, int]:
         """
         Resolve combat between two teams.
-        
+
         Args:
             team1: List of champions for team 1
             team2: List of champions for team 2
             round_number: Current round number (affects damage)
-            
+
         Returns:
             Tuple of (winner, damage_dealt)
             - winner: 0 for team1, 1 for team2, -1 for draw
             - damage_dealt: Damage to losing player's health
         """
-        if self.config.combat_mode == "statistical":
-            return self._statistical_combat(team1, team2, round_number)
-        elif self.config.combat_mode == "simplified":
-            # TODO: Phase 2 - simplified simulation
-            return self._statistical_combat(team1, team2, round_number)
-        else:
-            # TODO: Phase 4 - full simulation
-            return self._statistical_combat(team1, team2, round_number)
+        return self._resolve(team1, team2, round_number)
     
     def _statistical_combat(
         self,
@@ -134,9 +138,9 @@ class CombatSimulator:
             )
 
             # Shield bonus (e.g. Exiles II): temporary so weighted at 0.5
-            # relative to permanent HP.  _shield is set by augment passives
-            # before each combat and reset each round.
-            champ_power += getattr(champion, '_shield', 0.0) * 0.5
+            # relative to permanent HP.  _shield is a slotted Champion
+            # field (default 0.0) set by augment passives before combat.
+            champ_power += champion._shield * 0.5
 
             # Cost scaling (higher cost champions are stronger)
             cost_bonus = champion.cost * 150
@@ -8,15 +8,21 @@ Orchestrates game rounds including:
 - Round transitions
 - Win/loss determination
 """
+import operator
 import random
+from array import array
+from bisect import bisect_left
+from collections import deque
 from typing import List, Dict, Tuple, Optional
+from simulator.core.champion import create_champion
 from simulator.core.player import Player
 from simulator.engine.combat import CombatSimulator
 from simulator.config import TFTConfig, GameConstants
 
 
-# Item components that can drop from minion rounds / carousel
-ITEM_COMPONENTS = [
+# Item components that can drop from minion rounds / carousel.
+# A tuple: immutable, and random.choices indexes it directly.
+ITEM_COMPONENTS = (
     "TFT_Item_BFSword",
     "TFT_Item_RecurveBow",
     "TFT_Item_ChainVest",
@@ -25,7 +31,11 @@ ITEM_COMPONENTS = [
     "TFT_Item_TearOfTheGoddess",
     "TFT_Item_GiantsBelt",
     "TFT_Item_SparringGloves",
-]
+)
+
+# Sorted once at import so advance_round can count passed carousel rounds
+# with a C-level binary search instead of a generator scan
+_CAROUSEL_SORTED = tuple(sorted(GameConstants.CAROUSEL_ROUNDS))
 
 
 class GameRound:
@@ -39,8 +49,23 @@ class GameRound:
     - Carousel round handling (rounds 9, 18, 27, 36)
     - Damage calculation
     - Round progression
+
+    Uses __slots__ like Player: round state is touched every phase of
+    every simulated game, so attributes live at fixed offsets instead of
+    in a per-instance dict. Any new attribute must be added here.
     """
 
+    __slots__ = (
+        "players", "combat_sim", "config",
+        "current_round", "current_stage",
+        "_round_type_table",
+        "_combat_rounds", "_combat_p1", "_combat_p2",
+        "_combat_winner", "_combat_damage",
+        "_alive_cache", "_alive_dirty",
+        "recent_opponents", "_ring_idx",
+        "_combat_results_buf",
+    )
+
     def __init__(self, players: List[Player], combat_sim: CombatSimulator, config: TFTConfig):
         """
         Initialize game round manager.
@@ -58,11 +83,52 @@ class GameRound:
         self.current_round = 1
         self.current_stage = 1
 
-        # Combat history
-        self.combat_results: List[Dict] = []
-
-        # Matchmaking tracking
-        self.recent_opponents: Dict[int, List[int]] = {i: [] for i in range(len(players))}
+        # Round-type lookup table: get_round_type sits on the dispatch path
+        # of every combat phase, so resolve the carousel/minion membership
+        # chains once up front.
+        self._round_type_table: Dict[int, str] = {
+            r: (
+                "carousel" if r in GameConstants.CAROUSEL_ROUNDS
+                else "minion" if r in GameConstants.MINION_ROUNDS
+                else "combat"
+            )
+            for r in range(1, config.max_game_rounds + 1)
+        }
+
+        # Combat history, stored as parallel typed columns (one int array
+        # per field) instead of a dict per combat. The list grows for the
+        # whole game, so the columnar layout keeps memory flat; use
+        # combat_results_view() to get the dict-per-combat shape back.
+        self._combat_rounds = array('i')
+        self._combat_p1 = array('i')
+        self._combat_p2 = array('i')
+        self._combat_winner = array('i')
+        self._combat_damage = array('i')
+
+        # Alive-player cache: phases scan self.players several times per
+        # round, but deaths only happen inside the PvP phase. The cache is
+        # invalidated whenever combat damage is applied.
+        self._alive_cache: List[Player] = list(players)
+        self._alive_dirty = True
+
+        # Reusable per-round results buffer for the combat phases. Cleared
+        # at the start of each PvP/minion phase, so callers must consume
+        # the returned dict before the next combat phase (the event engine
+        # does: END_COMBAT/END_ROUND fire before the next START_COMBAT)
+        # or copy() it if they need to retain it across rounds.
+        self._combat_results_buf: Dict[int, Tuple[int, int]] = {}
+
+        # Matchmaking tracking: last 3 opponents per player, stored as a
+        # fixed 3-slot ring buffer (-1 = empty slot) plus a write index.
+        # Membership is three integer compares and recording an opponent
+        # is one slot write — no allocation in the steady state. Plain
+        # Python lists beat an (n_players, 3) int8 ndarray here: scalar
+        # ndarray indexing boxes each element and is slower than list
+        # access at lobby sizes, and the engine layer stays numpy-free.
+        self.recent_opponents: Dict[int, List[int]] = {
+            i: [-1, -1, -1] for i in range(len(players))
+        }
+        self._ring_idx: Dict[int, int] = {i: 0 for i in range(len(players))}
 
     # ===== Round type detection =====
 
@@ -72,11 +138,16 @@ class GameRound:
 
         Returns one of: "carousel", "minion", "combat"
         """
-        if round_number in GameConstants.CAROUSEL_ROUNDS:
-            return "carousel"
-        if round_number in GameConstants.MINION_ROUNDS:
-            return "minion"
-        return "combat"
+        return self._round_type_table.get(round_number, "combat")
+
+    # ===== Alive-player cache =====
+
+    def _get_alive_players(self) -> List[Player]:
+        """Return the (cached) list of alive players."""
+        if self._alive_dirty:
+            self._alive_cache = [p for p in self.players if p.is_alive]
+            self._alive_dirty = False
+        return self._alive_cache
 
     # ===== Planning phase =====
 
@@ -89,16 +160,15 @@ class GameRound:
         - Reset action counts
         - Round 1 special: grant each player 1 free 1-cost champion
         """
-        for player in self.players:
-            if player.is_alive:
-                # Generate new shop
-                player._generate_shop()
+        for player in self._get_alive_players():
+            # Generate new shop
+            player._generate_shop()
 
-                # Give round gold + interest + streak bonus
-                player.start_of_round_gold()
+            # Give round gold + interest + streak bonus
+            player.start_of_round_gold()
 
-                # Track round
-                player.rounds_survived += 1
+            # Track round
+            player.rounds_survived += 1
 
         # Round 1 special: grant each alive player 1 free 1-cost champion
         if self.current_round == 1:
@@ -109,52 +179,54 @@ class GameRound:
         Grant each alive player 1 free random 1-cost champion drawn from
         the shared pool. Called at the start of round 1 (first minion round).
         """
-        # Collect all available 1-cost champion IDs from the pool
+        # Collect all available 1-cost champion IDs from the pool, using
+        # the pool's static cost index instead of re-deriving cost per id
         pool = self.players[0].pool  # shared pool reference
         one_cost_ids = [
-            champ_id
-            for champ_id, count in pool.pool.items()
-            if count > 0 and pool.data_loader.get_champion_by_id(champ_id) is not None
-            and pool.data_loader.get_champion_by_id(champ_id).cost == 1
+            champ_id for champ_id in pool.ids_by_cost[1] if pool.pool[champ_id] > 0
         ]
 
-        for player in self.players:
-            if not player.is_alive:
-                continue
-
-            if not one_cost_ids:
-                break
+        alive_players = self._get_alive_players()
+        if not one_cost_ids or not alive_players:
+            return
 
-            # Sample one at random (without replacement from the pool)
-            champion_id = random.choice(one_cost_ids)
-            champion_data = pool.data_loader.get_champion_by_id(champion_id)
-            if champion_data is None:
-                continue
+        # Draw all grants in one weighted batch (weights = pool counts) so
+        # the draw distribution matches per-player sampling without
+        # re-filtering the pool between players. Pool depletion between
+        # draws is handled by the acquire() fallback below.
+        weights = [pool.pool[champ_id] for champ_id in one_cost_ids]
+        draws = random.choices(one_cost_ids, weights=weights, k=len(alive_players))
 
-            # Acquire from pool (may fail if depleted between iterations)
+        for player, champion_id in zip(alive_players, draws):
+            # Acquire from pool (may fail if depleted between draws)
             if not pool.acquire(champion_id):
-                # Try to pick another available one
                 available = [c for c in one_cost_ids if pool.is_available(c)]
                 if not available:
                     break
                 champion_id = random.choice(available)
-                champion_data = pool.data_loader.get_champion_by_id(champion_id)
-                if champion_data is None or not pool.acquire(champion_id):
+                if not pool.acquire(champion_id):
                     continue
 
-            from simulator.core.champion import create_champion
+            champion_data = pool.data_loader.get_champion_by_id(champion_id)
+            if champion_data is None:
+                pool.release(champion_id)
+                continue
+
             new_champ = create_champion(champion_data, stars=1)
             player._add_to_bench(new_champ)
 
     def end_planning_phase(self):
         """End planning phase, prepare for combat."""
-        for player in self.players:
-            if player.is_alive:
-                # Update active traits based on board
-                player.update_active_traits()
+        for player in self._get_alive_players():
+            # Update active traits based on board
+            player.update_active_traits()
+
+            # Reset champions for combat
+            player.reset_for_combat()
 
-                # Reset champions for combat
-                player.reset_for_combat()
+            # Snapshot the combat team; the board is stable from here
+            # until combat resolves, so the PvP phase reads this directly
+            player._combat_team_snapshot = player.board.get_all_champions()
 
     # ===== Combat dispatch =====
 
@@ -164,8 +236,15 @@ class GameRound:
 
         Returns:
             Dict mapping player_id -> (opponent_id, damage_taken)
-            (empty dict for carousel rounds)
+            (empty dict for carousel rounds). The dict is a buffer reused
+            every round: consume it before the next combat phase, or
+            copy() it to retain it.
         """
+        # End-of-game short-circuit: with at most one player left there is
+        # nothing to fight or grant, so skip phase dispatch entirely
+        if len(self._get_alive_players()) <= 1:
+            return {}
+
         round_type = self.get_round_type(self.current_round)
 
         if round_type == "carousel":
@@ -187,13 +266,20 @@ class GameRound:
         Returns:
             Dict mapping player_id -> (opponent_id, damage_taken)
         """
-        alive_players = [p for p in self.players if p.is_alive]
+        alive_players = self._get_alive_players()
 
         if len(alive_players) <= 1:
             return {}
 
         matchups = self._determine_matchups(alive_players)
-        combat_results = {}
+        combat_results = self._combat_results_buf
+        combat_results.clear()
+
+        # Combats are resolved serially on purpose. The statistical combat
+        # mode is a handful of float ops per matchup, so shipping champion
+        # objects to a ProcessPoolExecutor costs orders of magnitude more
+        # in pickling than the combat itself. Revisit if/when the Phase 4
+        # full simulation makes individual combats CPU-bound.
 
         for player1_id, player2_id in matchups:
             if player2_id == -1:
@@ -205,42 +291,66 @@ class GameRound:
             player1 = self.players[player1_id]
             player2 = self.players[player2_id]
 
-            team1 = player1.board.get_all_champions()
-            team2 = player2.board.get_all_champions()
+            team1 = player1._combat_team_snapshot
+            team2 = player2._combat_team_snapshot
 
             winner, damage = self.combat_sim.resolve_combat(
                 team1, team2, self.current_round
             )
 
+            # Normalize outcome to (winner_p, loser_p) once, then apply
+            # damage/results/streaks through a single write path. Draws
+            # (-1) flow through the same path with damage forced to 0 and
+            # both streaks reset.
             if winner == 0:
-                player2.take_damage(damage)
-                combat_results[player2_id] = (player1_id, damage)
-                combat_results[player1_id] = (player2_id, 0)
-                player1.update_streak(won=True)
-                player2.update_streak(won=False)
+                winner_p, loser_p = player1, player2
             elif winner == 1:
-                player1.take_damage(damage)
-                combat_results[player1_id] = (player2_id, damage)
-                combat_results[player2_id] = (player1_id, 0)
-                player2.update_streak(won=True)
-                player1.update_streak(won=False)
+                winner_p, loser_p = player2, player1
             else:
-                # Draw: no damage, streaks reset to 0
-                combat_results[player1_id] = (player2_id, 0)
-                combat_results[player2_id] = (player1_id, 0)
-                player1.update_streak(won=False)
-                player2.update_streak(won=False)
-
-            self.combat_results.append({
-                "round": self.current_round,
-                "player1": player1_id,
-                "player2": player2_id,
-                "winner": winner,
-                "damage": damage
-            })
+                winner_p, loser_p = player1, player2
+                damage = 0
+
+            loser_p.take_damage(damage)
+            combat_results[loser_p.player_id] = (winner_p.player_id, damage)
+            combat_results[winner_p.player_id] = (loser_p.player_id, 0)
+            winner_p.update_streak(won=winner != -1)
+            loser_p.update_streak(won=False)
+
+            self._combat_rounds.append(self.current_round)
+            self._combat_p1.append(player1_id)
+            self._combat_p2.append(player2_id)
+            self._combat_winner.append(winner)
+            self._combat_damage.append(damage)
+
+        # Combat damage may have eliminated players
+        self._alive_dirty = True
 
         return combat_results
 
+    def combat_results_view(self) -> List[Dict]:
+        """
+        Return the combat history as a list of dicts (one per combat).
+
+        Materialized on demand from the columnar storage; intended for
+        logging/analysis, not hot-path use.
+        """
+        return [
+            {
+                "round": rnd,
+                "player1": p1,
+                "player2": p2,
+                "winner": winner,
+                "damage": damage,
+            }
+            for rnd, p1, p2, winner, damage in zip(
+                self._combat_rounds,
+                self._combat_p1,
+                self._combat_p2,
+                self._combat_winner,
+                self._combat_damage,
+            )
+        ]
+
     # ===== Minion round =====
 
     def _run_minion_phase(self) -> Dict[int, Tuple[int, int]]:
@@ -253,20 +363,25 @@ class GameRound:
         Returns:
             Dict mapping player_id -> (-1, 0)  (opponent=-1, no player damage)
         """
-        combat_results = {}
-
-        for player in self.players:
-            if not player.is_alive:
-                continue
+        combat_results = self._combat_results_buf
+        combat_results.clear()
+        alive_players = self._get_alive_players()
+
+        # Rounds 2-3: grant 1 item component on win. One batched draw for
+        # all players instead of a random.choice call each.
+        grants_items = self.current_round in (2, 3)
+        components = (
+            random.choices(ITEM_COMPONENTS, k=len(alive_players))
+            if grants_items else ()
+        )
 
+        for i, player in enumerate(alive_players):
             # Minion rounds: all players win (simplified PvE)
             combat_results[player.player_id] = (-1, 0)
             player.update_streak(won=True)
 
-            # Rounds 2-3: grant 1 item component on win
-            if self.current_round in (2, 3):
-                component = random.choice(ITEM_COMPONENTS)
-                player.grant_item_component(component)
+            if grants_items:
+                player.grant_item_component(components[i])
 
         return combat_results
 
@@ -279,10 +394,10 @@ class GameRound:
         Each alive player receives 1 random item component.
         In a full implementation this would be the pick-a-unit mechanic.
         """
-        for player in self.players:
-            if player.is_alive:
-                component = random.choice(ITEM_COMPONENTS)
-                player.grant_item_component(component)
+        alive_players = self._get_alive_players()
+        components = random.choices(ITEM_COMPONENTS, k=len(alive_players))
+        for player, component in zip(alive_players, components):
+            player.grant_item_component(component)
 
     # ===== Matchmaking =====
 
@@ -291,58 +406,172 @@ class GameRound:
         Determine who fights who.
 
         Uses ghost matchmaking if odd number of players.
-        Tries to avoid repeat matchups when possible.
+
+        Finds the minimum-penalty perfect matching over the alive players,
+        where a pair is penalized by how recently its two players last met.
+        TFT lobbies have at most 8 players, so exact matching by exhaustive
+        pairing search is cheap (105 pairings for 8 players). Unlike the
+        old greedy pairing, this never forces a repeat matchup late in the
+        loop when a repeat-free pairing exists.
+
+        Deliberately not specialized per lobby size with exec-generated
+        unrolled matchers: the search is a few microseconds once per
+        round, and exec'd code is invisible to tracebacks, coverage and
+        grep — the wrong trade for this codebase.
 
         Args:
             alive_players: List of alive players
 
         Returns:
-            List of (player1_id, player2_id) tuples
+            List of (player1_id, player2_id) tuples; player2_id == -1 marks
+            a ghost round for an odd player out.
         """
+        ids = [p.player_id for p in alive_players]
+        random.shuffle(ids)  # random tie-breaking among equal-cost pairings
+
+        if len(ids) % 2 == 1:
+            ids.append(-1)  # ghost opponent for the odd player out
+
+        # Lobbies are capped at 8 players; guard the factorial search anyway.
+        if len(ids) <= 10:
+            _, pairs = self._best_pairing(ids)
+        else:
+            pairs = None
+
+        if pairs is None:
+            return self._determine_matchups_greedy(ids)
+
         matchups = []
-        available = [p.player_id for p in alive_players]
-        random.shuffle(available)
+        for p1, p2 in pairs:
+            if p1 == -1:
+                p1, p2 = p2, p1
+            matchups.append((p1, p2))
+            if p2 != -1:
+                self._record_matchup(p1, p2)
+                self._record_matchup(p2, p1)
+
+        return matchups
+
+    def _best_pairing(self, ids: List[int]) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """
+        Exhaustively find the minimum-cost perfect matching of ids.
+
+        Returns:
+            (total_cost, list of pairs).  pairs is never None for any input
+            the caller produces: the recursion base case returns (0, []) for
+            empty input, and _determine_matchups always passes an even-sized
+            list (odd player counts get a -1 bye).  The greedy fallback in
+            _determine_matchups is selected by the len(ids) > 10 size guard,
+            not by this function's return value.
+        """
+        if not ids:
+            return 0, []
 
-        while len(available) >= 2:
-            p1 = available.pop(0)
+        first = ids[0]
+        best_cost = -1
+        best_pairs: Optional[List[Tuple[int, int]]] = None
+
+        for i in range(1, len(ids)):
+            partner = ids[i]
+            rest = ids[1:i] + ids[i + 1:]
+            sub_cost, sub_pairs = self._best_pairing(rest)
+            cost = sub_cost + self._pair_cost(first, partner)
+
+            if best_pairs is None or cost < best_cost:
+                best_cost = cost
+                best_pairs = [(first, partner)] + sub_pairs
+
+        return best_cost, best_pairs
+
+    def _pair_cost(self, p1: int, p2: int) -> int:
+        """
+        Penalty for pairing p1 vs p2: higher the more recently they met.
+
+        Ghost pairings (-1) carry no penalty.
+        """
+        if p1 == -1 or p2 == -1:
+            return 0
+
+        cost = 0
+        # age 0 = most recent opponent -> weight 3, then 2, then 1.
+        # The write index points at the oldest slot, so most recent is
+        # (idx - 1) % 3, walking backwards through the ring.
+        for pid, opp in ((p1, p2), (p2, p1)):
+            ring = self.recent_opponents[pid]
+            idx = self._ring_idx[pid]
+            for age in range(3):
+                if ring[(idx - 1 - age) % 3] == opp:
+                    cost += 3 - age
+        return cost
+
+    def _determine_matchups_greedy(self, ids: List[int]) -> List[Tuple[int, int]]:
+        """
+        Greedy fallback pairing for oversized lobbies (not reachable with
+        the standard 8-player lobby).
+        """
+        matchups = []
+        # Deque + lazy deletion: popleft is O(1) (list.pop(0) shifts the
+        # whole tail), and the parallel `remaining` set stands in for
+        # removing opponents from the middle of the queue.
+        available = deque(i for i in ids if i != -1)
+        remaining = set(available)
+        has_ghost = len(remaining) != len(ids)
+
+        while len(remaining) >= 2:
+            p1 = available.popleft()
+            if p1 not in remaining:
+                continue  # already taken as someone's opponent
+            remaining.discard(p1)
 
             # Try to find opponent who hasn't fought recently
             p2: Optional[int] = None
+            ring = self.recent_opponents[p1]
             for candidate in available:
-                if candidate not in self.recent_opponents[p1][-3:]:
+                if (candidate in remaining
+                        and candidate != ring[0]
+                        and candidate != ring[1]
+                        and candidate != ring[2]):
                     p2 = candidate
                     break
 
             if p2 is None:
-                p2 = available.pop(0)
-            else:
-                available.remove(p2)
+                # Everyone left is a recent opponent; take the first one
+                for candidate in available:
+                    if candidate in remaining:
+                        p2 = candidate
+                        break
+            remaining.discard(p2)
 
             matchups.append((p1, p2))
 
-            self.recent_opponents[p1].append(p2)
-            self.recent_opponents[p2].append(p1)
+            self._record_matchup(p1, p2)
+            self._record_matchup(p2, p1)
 
         # Handle odd player (ghost round)
-        if available:
-            ghost_player = available[0]
-            matchups.append((ghost_player, -1))
+        if has_ghost and remaining:
+            matchups.append((next(iter(remaining)), -1))
 
         return matchups
 
+    def _record_matchup(self, player_id: int, opponent_id: int):
+        """Record opponent_id as player_id's most recent opponent."""
+        idx = self._ring_idx[player_id]
+        self.recent_opponents[player_id][idx] = opponent_id
+        self._ring_idx[player_id] = (idx + 1) % 3
+
     # ===== Round lifecycle =====
 
     def advance_round(self):
         """Advance to next round."""
         self.current_round += 1
-        self.current_stage = (
-            sum(1 for c in GameConstants.CAROUSEL_ROUNDS if self.current_round > c) + 1
-        )
+        # bisect_left counts carousel rounds strictly below current_round,
+        # matching the old `current_round > c` predicate
+        self.current_stage = bisect_left(_CAROUSEL_SORTED, self.current_round) + 1
 
     def is_game_over(self) -> bool:
         """Check if game is over."""
-        alive_count = sum(1 for p in self.players if p.is_alive)
-        return alive_count <= 1 or self.current_round > self.config.max_game_rounds
+        return (len(self._get_alive_players()) <= 1
+                or self.current_round > self.config.max_game_rounds)
 
     def get_placements(self) -> Dict[int, int]:
         """
@@ -351,22 +580,21 @@ class GameRound:
         Returns:
             Dict mapping player_id -> placement (1-8)
         """
+        # Single pass to partition alive from dead, then sort the dead by
+        # survival time with a C-implemented key (attrgetter beats a lambda)
         placements = {}
+        dead_players = []
+        for player in self.players:
+            if player.is_alive:
+                placements[player.player_id] = 1
+            else:
+                dead_players.append(player)
 
-        alive_players = [p for p in self.players if p.is_alive]
-        for player in alive_players:
-            placements[player.player_id] = 1
-
-        dead_players = [
-            (p.player_id, p.rounds_survived)
-            for p in self.players if not p.is_alive
-        ]
-        dead_players.sort(key=lambda x: x[1], reverse=True)
+        dead_players.sort(key=operator.attrgetter("rounds_survived"), reverse=True)
 
-        current_placement = len(alive_players) + 1
-        for player_id, _ in dead_players:
-            placements[player_id] = current_placement
-            current_placement += 1
+        start = len(placements) + 1
+        for placement, player in enumerate(dead_players, start=start):
+            placements[player.player_id] = placement
 
         return placements
 
@@ -374,5 +602,15 @@ class GameRound:
         """Reset round state for new game."""
         self.current_round = 1
         self.current_stage = 1
-        self.combat_results.clear()
-        self.recent_opponents = {i: [] for i in range(len(self.players))}
+        for column in (
+            self._combat_rounds,
+            self._combat_p1,
+            self._combat_p2,
+            self._combat_winner,
+            self._combat_damage,
+        ):
+            del column[:]
+        self.recent_opponents = {i: [-1, -1, -1] for i in range(len(self.players))}
+        self._ring_idx = {i: 0 for i in range(len(self.players))}
+        self._combat_results_buf.clear()
+        self._alive_dirty = True
@@ -5,7 +5,7 @@ Implements hierarchical action space with masking:
 - Level 1: Action type (7 options)
 - Level 2: Action parameters (conditional on type)
 """
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import IntEnum
 import numpy as np
 
@@ -59,6 +59,58 @@ class ActionSpace:
         self.num_bench_positions = config.bench_size  # 9
         self.num_total_positions = self.num_board_positions + self.num_bench_positions  # 37
 
+        # Preallocated mask buffers, refilled on every get_action_mask
+        # call. env.step asks for masks every step, so reusing the arrays
+        # avoids five allocations per step; callers that retain masks
+        # across steps must copy them. The three position masks share one
+        # contiguous (3, 37) block — they are always produced and consumed
+        # together, so keeping them on adjacent cache lines helps both the
+        # fill and the downstream flatnonzero scans.
+        self._pos_mask_buf = np.zeros((3, self.num_total_positions), dtype=bool)
+        self._masks: Dict[str, np.ndarray] = {
+            'action_type': np.zeros(self.num_action_types, dtype=bool),
+            'shop_slot': np.zeros(self.num_shop_slots, dtype=bool),
+            'sell_position': self._pos_mask_buf[0],
+            'move_from': self._pos_mask_buf[1],
+            'move_to': self._pos_mask_buf[2],
+        }
+
+        # Batched mask buffers for vectorized envs, (re)allocated lazily
+        # when the batch size changes; see get_action_mask_batch
+        self._batch_bufs: Optional[Dict[str, np.ndarray]] = None
+
+        # Dedicated generator for random-action sampling: default_rng
+        # (PCG64) integer draws are much cheaper than np.random.choice on
+        # the tiny index arrays this class works with
+        self._rng = np.random.default_rng()
+
+        # Position decode/encode tables: flat index <-> (row, col), with
+        # row -1 marking bench slots. Built once so the per-action decode
+        # is a single tuple lookup instead of branch + div/mod.
+        cols = config.board_size[1]
+        self._pos_table: Tuple[Tuple[int, int], ...] = tuple(
+            (p // cols, p % cols) for p in range(self.num_board_positions)
+        ) + tuple((-1, b) for b in range(self.num_bench_positions))
+        self._coords_table: Dict[Tuple[int, int], int] = {
+            coords: pos for pos, coords in enumerate(self._pos_table)
+        }
+
+        # execute_action dispatch table, indexed by the action-type int.
+        # Entry order must match ActionType. Each adapter takes the full
+        # parameter list and ignores what its action doesn't use.
+        self._dispatch = (
+            lambda p, ss, sp, mf, mt: True,                       # PASS
+            lambda p, ss, sp, mf, mt: p.buy_xp(),                 # BUY_XP
+            lambda p, ss, sp, mf, mt: p.refresh_shop(),           # REFRESH_SHOP
+            lambda p, ss, sp, mf, mt: p.buy_champion_from_shop(ss),  # BUY_CHAMPION
+            lambda p, ss, sp, mf, mt: p.sell_champion(
+                self._position_to_coords(sp)),                    # SELL_CHAMPION
+            lambda p, ss, sp, mf, mt: p.move_champion(
+                self._position_to_coords(mf),
+                self._position_to_coords(mt)),                    # MOVE_CHAMPION
+            lambda p, ss, sp, mf, mt: False,                      # LOCK_SHOP (Phase 2+)
+        )
+
     def get_action_mask(self, player: Player) -> Dict[str, np.ndarray]:
         """
         Generate action mask for current player state.
@@ -76,11 +128,15 @@ class ActionSpace:
             - 'sell_position': [num_total_positions] - which positions have units to sell
             - 'move_from': [num_total_positions] - which positions have units to move
             - 'move_to': [num_total_positions] - which positions can receive units
+
+            The arrays are shared buffers reused on the next call; copy
+            them if they need to outlive this step.
         """
-        mask = {}
+        mask = self._masks
 
         # Action type mask
-        action_type_mask = np.ones(self.num_action_types, dtype=bool)
+        action_type_mask = mask['action_type']
+        action_type_mask.fill(False)
 
         # PASS is always valid
         action_type_mask[ActionType.PASS] = True
@@ -96,9 +152,12 @@ class ActionSpace:
             player.gold >= self.config.shop_refresh_cost or player.free_rerolls > 0
         )
 
+        # Shop slot mask (for BUY_CHAMPION), computed up front so the
+        # BUY_CHAMPION flag can derive from it instead of a second scan
+        shop_mask = self._get_shop_mask(player, mask['shop_slot'])
+
         # BUY_CHAMPION: at least one affordable champion in shop
-        has_buyable_champion = self._has_buyable_champion(player)
-        action_type_mask[ActionType.BUY_CHAMPION] = has_buyable_champion
+        action_type_mask[ActionType.BUY_CHAMPION] = bool(shop_mask.any())
 
         # SELL_CHAMPION: has at least one unit
         has_units = player.get_total_unit_count() > 0
@@ -110,111 +169,87 @@ class ActionSpace:
         # LOCK_SHOP: disabled for now (Phase 2+)
         action_type_mask[ActionType.LOCK_SHOP] = False
 
-        mask['action_type'] = action_type_mask
-
-        # Shop slot mask (for BUY_CHAMPION)
-        mask['shop_slot'] = self._get_shop_mask(player)
-
         # Position masks (for SELL_CHAMPION and MOVE_CHAMPION)
-        sell_mask, move_from_mask, move_to_mask = self._get_position_masks(player)
-        mask['sell_position'] = sell_mask
-        mask['move_from'] = move_from_mask
-        mask['move_to'] = move_to_mask
+        self._get_position_masks(
+            player, mask['sell_position'], mask['move_from'], mask['move_to']
+        )
 
         return mask
 
-    def _has_buyable_champion(self, player: Player) -> bool:
-        """Check if player can afford any champion in shop."""
-        for champion_id in player.shop:
-            if champion_id is not None:
-                champ_data = player.data_loader.get_champion_by_id(champion_id)
-                if champ_data and player.gold >= champ_data.cost:
-                    if player.pool.is_available(champion_id):
-                        return True
-        return False
-
-    def _get_shop_mask(self, player: Player) -> np.ndarray:
+    def _get_shop_mask(self, player: Player, mask: np.ndarray) -> np.ndarray:
         """
-        Generate mask for shop slots.
+        Fill `mask` (shape [num_shop_slots]) with the shop-slot validity.
 
         A slot is valid if:
         1. Champion exists in that slot
         2. Player can afford it
         3. Champion is available in pool
 
+        Reads the pre-resolved player.shop_data entries, so no data-loader
+        lookups happen here.
+
         Returns:
-            Boolean array of shape [num_shop_slots]
+            The filled mask buffer.
         """
-        mask = np.zeros(self.num_shop_slots, dtype=bool)
-
-        for i, champion_id in enumerate(player.shop):
-            if champion_id is None:
-                mask[i] = False
-                continue
+        mask.fill(False)
 
-            # Check if can afford
-            champ_data = player.data_loader.get_champion_by_id(champion_id)
-            if not champ_data:
-                mask[i] = False
-                continue
-
-            if player.gold < champ_data.cost:
-                mask[i] = False
-                continue
-
-            # Check if available in pool
-            if not player.pool.is_available(champion_id):
-                mask[i] = False
-                continue
-
-            mask[i] = True
+        gold = player.gold
+        is_available = player.pool.is_available
+        for i, champ_data in enumerate(player.shop_data):
+            if (champ_data is not None
+                    and gold >= champ_data.cost
+                    and is_available(champ_data.champion_id)):
+                mask[i] = True
 
         return mask
 
-    def _get_position_masks(self, player: Player) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def _get_position_masks(
+        self,
+        player: Player,
+        sell_mask: np.ndarray,
+        move_from_mask: np.ndarray,
+        move_to_mask: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Generate position masks for SELL and MOVE actions.
+        Fill the position masks for SELL and MOVE actions.
 
         Position encoding:
         - Positions 0-27: Board (row-major order: row0col0, row0col1, ..., row3col6)
         - Positions 28-36: Bench (bench slot 0-8)
 
         Returns:
-            Tuple of (sell_mask, move_from_mask, move_to_mask)
+            Tuple of the filled (sell_mask, move_from_mask, move_to_mask)
+            buffers.
         """
-        sell_mask = np.zeros(self.num_total_positions, dtype=bool)
-        move_from_mask = np.zeros(self.num_total_positions, dtype=bool)
-        move_to_mask = np.zeros(self.num_total_positions, dtype=bool)
-
-        # Board positions (0-27)
-        board_rows, board_cols = self.config.board_size
-        for row in range(board_rows):
-            for col in range(board_cols):
-                pos_idx = row * board_cols + col
-
-                champion = player.board.get(row, col)
-                if champion is not None:
-                    # Can sell or move from this position
-                    sell_mask[pos_idx] = True
-                    move_from_mask[pos_idx] = True
-                else:
-                    # Can move to this position if board not full
-                    current_board_count = player.board.count_champions()
-                    max_units = self.config.max_units_by_level[player.level]
-                    if current_board_count < max_units:
-                        move_to_mask[pos_idx] = True
-
-        # Bench positions (28-36)
-        for bench_idx, champion in enumerate(player.bench):
-            pos_idx = self.num_board_positions + bench_idx
-
-            if champion is not None:
-                # Can sell or move from bench
-                sell_mask[pos_idx] = True
-                move_from_mask[pos_idx] = True
-            else:
-                # Can move to empty bench slot
-                move_to_mask[pos_idx] = True
+        n_board = self.num_board_positions
+
+        # Board occupancy in one pass: the grid dict is initialized in
+        # row-major order and never re-keyed, so its value order matches
+        # the flat position encoding
+        occ_board = np.fromiter(
+            (champ is not None for champ in player.board.grid.values()),
+            dtype=bool, count=n_board,
+        )
+        occ_bench = np.fromiter(
+            (champ is not None for champ in player.bench),
+            dtype=bool, count=self.num_bench_positions,
+        )
+
+        # Occupied positions can be sold or moved from
+        sell_mask[:n_board] = occ_board
+        sell_mask[n_board:] = occ_bench
+        move_from_mask[:] = sell_mask
+
+        # Empty board cells accept moves only while the board has space;
+        # empty bench slots always do
+        board_has_space = (
+            int(occ_board.sum()) < self.config.max_units_by_level[player.level]
+        )
+        if board_has_space:
+            np.logical_not(occ_board, out=move_to_mask[:n_board])
+        else:
+            move_to_mask[:n_board] = False
+        np.logical_not(occ_bench, out=move_to_mask[n_board:])
 
         return sell_mask, move_from_mask, move_to_mask
 
@@ -241,35 +276,16 @@ class ActionSpace:
         Returns:
             True if action executed successfully, False otherwise
         """
-        action_type = ActionType(action_type)
-
-        if action_type == ActionType.PASS:
-            return True
-
-        elif action_type == ActionType.BUY_XP:
-            return player.buy_xp()
-
-        elif action_type == ActionType.REFRESH_SHOP:
-            return player.refresh_shop()
-
-        elif action_type == ActionType.BUY_CHAMPION:
-            return player.buy_champion_from_shop(shop_slot)
-
-        elif action_type == ActionType.SELL_CHAMPION:
-            row, col = self._position_to_coords(sell_position)
-            return player.sell_champion((row, col))
-
-        elif action_type == ActionType.MOVE_CHAMPION:
-            from_row, from_col = self._position_to_coords(move_from)
-            to_row, to_col = self._position_to_coords(move_to)
-            return player.move_champion((from_row, from_col), (to_row, to_col))
-
-        elif action_type == ActionType.LOCK_SHOP:
-            # Not implemented yet
-            return False
-
-        else:
+        # No ActionType() cast: the int comes from the masked action space
+        # and is already 0-6; reconstruction would linearly scan the enum
+        # members on every step.  Range check stays a real ValueError so
+        # bad action types fail the same way as the enum cast did (and
+        # are not stripped under python -O).
+        if not 0 <= action_type < self.num_action_types:
             raise ValueError(f"Unknown action type: {action_type}")
+        return self._dispatch[action_type](
+            player, shop_slot, sell_position, move_from, move_to
+        )
 
     def _position_to_coords(self, position: int) -> Tuple[int, int]:
         """
@@ -285,16 +301,7 @@ class ActionSpace:
         Returns:
             (row, col) tuple where row=-1 indicates bench
         """
-        if position < self.num_board_positions:
-            # Board position
-            board_cols = self.config.board_size[1]
-            row = position // board_cols
-            col = position % board_cols
-            return (row, col)
-        else:
-            # Bench position
-            bench_idx = position - self.num_board_positions
-            return (-1, bench_idx)
+        return self._pos_table[position]
 
     def coords_to_position(self, row: int, col: int) -> int:
         """
@@ -307,13 +314,41 @@ class ActionSpace:
         Returns:
             Flat position index (0-36)
         """
-        if row == -1:
-            # Bench position
-            return self.num_board_positions + col
-        else:
-            # Board position
-            board_cols = self.config.board_size[1]
-            return row * board_cols + col
+        return self._coords_table[(row, col)]
+
+    def get_action_mask_batch(self, players: List[Player]) -> Dict[str, np.ndarray]:
+        """
+        Generate action masks for a batch of players (vectorized envs).
+
+        Writes every player's masks into contiguous (B, n) matrices, so a
+        policy network can consume the whole batch without per-env
+        concatenation. Game state lives in per-player Python objects, so
+        the extraction loop stays in Python (a compiled per-row kernel
+        would first need the state mirrored into arrays); the win here is
+        one reused allocation per batch and contiguous output.
+
+        Args:
+            players: Players to build masks for (one row each)
+
+        Returns:
+            Dict with the same keys as get_action_mask, each an array of
+            shape [len(players), n]. Buffers are reused across calls with
+            the same batch size; copy to retain.
+        """
+        batch_size = len(players)
+        bufs = self._batch_bufs
+        if bufs is None or len(next(iter(bufs.values()))) != batch_size:
+            bufs = self._batch_bufs = {
+                key: np.zeros((batch_size, buf.shape[0]), dtype=bool)
+                for key, buf in self._masks.items()
+            }
+
+        for b, player in enumerate(players):
+            masks = self.get_action_mask(player)
+            for key, buf in bufs.items():
+                buf[b] = masks[key]
+
+        return bufs
 
     def get_action_space_sizes(self) -> Dict[str, int]:
         """
@@ -339,39 +374,44 @@ class ActionSpace:
             Dictionary with sampled action components
         """
         mask = self.get_action_mask(player)
-
-        # Sample valid action type
-        valid_actions = np.where(mask['action_type'])[0]
-        if len(valid_actions) == 0:
-            # Fallback to PASS
-            action_type = ActionType.PASS
+        rng = self._rng
+
+        # Sample valid action type (flatnonzero avoids the tuple-wrapping
+        # of np.where, and rng.integers avoids np.random.choice overhead)
+        valid_actions = np.flatnonzero(mask['action_type'])
+        if valid_actions.size == 0:
+            # Fallback to PASS (comparisons below are plain int compares;
+            # ActionType members are IntEnums so no construction happens)
+            action_type = 0
         else:
-            action_type = np.random.choice(valid_actions)
+            action_type = int(valid_actions[rng.integers(valid_actions.size)])
 
         # Sample parameters based on action type
-        action = {'action_type': int(action_type)}
+        action = {'action_type': action_type}
 
         if action_type == ActionType.BUY_CHAMPION:
-            valid_slots = np.where(mask['shop_slot'])[0]
-            if len(valid_slots) > 0:
-                action['shop_slot'] = int(np.random.choice(valid_slots))
+            valid_slots = np.flatnonzero(mask['shop_slot'])
+            if valid_slots.size > 0:
+                action['shop_slot'] = int(valid_slots[rng.integers(valid_slots.size)])
             else:
                 action['shop_slot'] = 0
 
         elif action_type == ActionType.SELL_CHAMPION:
-            valid_positions = np.where(mask['sell_position'])[0]
-            if len(valid_positions) > 0:
-                action['sell_position'] = int(np.random.choice(valid_positions))
+            valid_positions = np.flatnonzero(mask['sell_position'])
+            if valid_positions.size > 0:
+                action['sell_position'] = int(
+                    valid_positions[rng.integers(valid_positions.size)]
+                )
             else:
                 action['sell_position'] = 0
 
         elif action_type == ActionType.MOVE_CHAMPION:
-            valid_from = np.where(mask['move_from'])[0]
-            valid_to = np.where(mask['move_to'])[0]
+            valid_from = np.flatnonzero(mask['move_from'])
+            valid_to = np.flatnonzero(mask['move_to'])
 
-            if len(valid_from) > 0 and len(valid_to) > 0:
-                action['move_from'] = int(np.random.choice(valid_from))
-                action['move_to'] = int(np.random.choice(valid_to))
+            if valid_from.size > 0 and valid_to.size > 0:
+                action['move_from'] = int(valid_from[rng.integers(valid_from.size)])
+                action['move_to'] = int(valid_to[rng.integers(valid_to.size)])
             else:
                 action['move_from'] = 0
                 action['move_to'] = 0
@@ -18,9 +18,13 @@ from simulator.env.augment_effects.registry import (
     AUGMENT_ELIGIBLE_ROUNDS,
     AUGMENT_REGISTRY,
     SYNTHETIC_AUGMENTS,
+    HookEvent,
     apply_augment_hook,
+    apply_augment_hook_by_name,
     apply_all_passives,
+    apply_all_passives_for_players,
     apply_all_stage_start_hooks,
+    apply_all_stage_start_hooks_for_players,
     get_eligible_augments,
 )
 
@@ -29,8 +33,12 @@ __all__ = [
     "AUGMENT_REGISTRY",
     "SYNTHETIC_AUGMENTS",
     "AUGMENT_ELIGIBLE_ROUNDS",
+    "HookEvent",
     "apply_augment_hook",
+    "apply_augment_hook_by_name",
     "apply_all_passives",
+    "apply_all_passives_for_players",
     "apply_all_stage_start_hooks",
+    "apply_all_stage_start_hooks_for_players",
     "get_eligible_augments",
 ]
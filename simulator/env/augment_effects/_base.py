@@ -8,8 +8,11 @@ Augment-specific helpers stay in their own module.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+from simulator.core.champion import create_champion
 
 if TYPE_CHECKING:
     from simulator.core.champion import Champion
@@ -20,7 +23,7 @@ if TYPE_CHECKING:
 # Return type
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AugmentResult:
     """
     Standardised return value for every augment hook.
@@ -35,11 +38,11 @@ class AugmentResult:
     specific augment fired.
     """
     success: bool = True
-    grants: List[str] = field(default_factory=list)
+    grants: Sequence[str] = ()
     """Champion names added to the player's bench this event."""
     gold_delta: int = 0
     """Gold given (or taken) by this hook call."""
-    affected_champions: List[str] = field(default_factory=list)
+    affected_champions: Sequence[str] = ()
     """Display names of champions whose stats were modified."""
     xp_delta: int = 0
     """XP granted (free, no gold cost) by this hook call."""
@@ -47,15 +50,28 @@ class AugmentResult:
     """Free shop rerolls added to the player by this hook call."""
 
 
+# Shared payload-free results.  Hooks fire for every augment every
+# combat, and most outcomes carry no payload, so the common paths return
+# these singletons instead of allocating.  Treat them as immutable.
+_EMPTY_OK = AugmentResult(success=True)
+_EMPTY_FAIL = AugmentResult(success=False)
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+def _iter_all_champions(player: "Player") -> Iterator["Champion"]:
+    """Lazily yield every champion the player owns (board + bench)."""
+    return chain(
+        player.board.get_all_champions(),
+        (c for c in player.bench if c is not None),
+    )
+
+
 def _get_all_champions(player: "Player") -> List["Champion"]:
     """Return every champion the player owns (board + bench)."""
-    champions: List["Champion"] = list(player.board.get_all_champions())
-    champions += [c for c in player.bench if c is not None]
-    return champions
+    return list(_iter_all_champions(player))
 
 
 def _grant_champion(player: "Player", champion_name: str) -> bool:
@@ -65,8 +81,6 @@ def _grant_champion(player: "Player", champion_name: str) -> bool:
     Returns True if successfully granted, False if the champion is not found
     in data or none remain in the pool.
     """
-    from simulator.core.champion import create_champion
-
     champion_data = player.data_loader.get_champion_by_name(champion_name)
     if champion_data is None:
         return False
@@ -13,7 +13,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from simulator.env.augment_effects._base import AugmentResult, _get_all_champions, _grant_champion
+from simulator.env.augment_effects._base import (
+    AugmentResult,
+    _EMPTY_FAIL,
+    _grant_champion,
+)
 
 if TYPE_CHECKING:
     from simulator.core.champion import Champion
@@ -35,26 +39,7 @@ ELIGIBLE_ROUNDS = None
 
 def _find_rumbles(player: "Player") -> List["Champion"]:
     """Return all Rumble units owned by the player."""
-    return [c for c in _get_all_champions(player) if c.name == "Rumble"]
-
-
-def _strongest_rumble(player: "Player") -> Optional["Champion"]:
-    """
-    Return the player's strongest Rumble.
-
-    Priority:
-      1. Board champions before bench champions (actively fighting).
-      2. Higher star level wins.
-      3. Ties broken by higher current HP (more durable).
-    """
-    board_rumbles = [c for c in player.board.get_all_champions() if c.name == "Rumble"]
-    bench_rumbles = [c for c in player.bench if c is not None and c.name == "Rumble"]
-
-    for pool in (board_rumbles, bench_rumbles):
-        if pool:
-            return max(pool, key=lambda c: (c.stars, c.current_hp))
-
-    return None
+    return player._units_by_name.get("Rumble", [])
 
 
 # ---------------------------------------------------------------------------
@@ -65,36 +50,69 @@ def _on_select(player: "Player", effects: Dict[str, Any]) -> AugmentResult:
     """Grant a Rumble unit when the augment is chosen."""
     granted = _grant_champion(player, "Rumble")
     if granted:
-        return AugmentResult(success=True, grants=["Rumble"])
-    return AugmentResult(success=False)
+        return AugmentResult(success=True, grants=("Rumble",))
+    return _EMPTY_FAIL
 
 
 def _passive(player: "Player", effects: Dict[str, Any]) -> AugmentResult:
     """
     Before each combat, find the strongest Rumble and apply bonuses.
 
-    Stats are mutated directly on the champion instance (not the shared
-    data template).  The reset loop restores base values each call so
-    bonuses never stack across successive passive applications.
+    Bonuses are stored on the champion instance (not the shared data
+    template).  Every Rumble's bonus is zeroed each call so bonuses never
+    stack across successive passive applications; attack_range itself is
+    never touched.
 
     Attributes modified on the Champion instance:
-        attack_range    — increased by MaxRange (e.g. +7 hexes)
-        _fires_missiles — (bool) signals combat engine to enable the
-                          continuous missile barrage scaled by attack_speed
+        _bonus_attack_range — extra range from MaxRange (e.g. +7 hexes);
+                              effective range is attack_range + bonus
+        _fires_missiles     — (bool) signals combat engine to enable the
+                              continuous missile barrage scaled by attack_speed
     """
-    bonus_range: int = int(effects.get("MaxRange", 0))
+    # Normalize MaxRange (floats in the crawled JSON) to an int once and
+    # cache it back onto the effects dict under a private key; the same
+    # dict is passed on every passive call for this augment instance.
+    # Dirty check: the passive only reads the Rumble roster and board
+    # placement, so if neither moved since the last application the
+    # previous writes still stand and the cached result is exact.
+    memo_key = (player.board.revision, player._units_revision)
+    cached = player._passive_memo.get(AUGMENT_ID)
+    if cached is not None and cached[0] == memo_key:
+        return cached[1]
+
+    bonus_range = effects.get("_max_range_int")
+    if bonus_range is None:
+        bonus_range = int(effects.get("MaxRange", 0))
+        effects["_max_range_int"] = bonus_range
+
+    # Single fused pass: reset every Rumble's bonuses while tracking the
+    # strongest one.  Board champions outrank benched (actively fighting);
+    # higher star level wins, ties broken by higher current HP.
+    best_board: Optional["Champion"] = None
+    best_bench: Optional["Champion"] = None
+    best_board_key = best_bench_key = (0, 0.0)
 
     for rumble in _find_rumbles(player):
-        rumble.attack_range = rumble.data.stats.attack_range or 1
+        rumble._bonus_attack_range = 0
         rumble._fires_missiles = False
-
-    target = _strongest_rumble(player)
+        key = (rumble.stars, rumble.current_hp)
+        # Board champions carry a (row, col) position; benched ones are None
+        if rumble.position is not None:
+            if best_board is None or key > best_board_key:
+                best_board, best_board_key = rumble, key
+        elif best_bench is None or key > best_bench_key:
+            best_bench, best_bench_key = rumble, key
+
+    target = best_board if best_board is not None else best_bench
     if target is None:
-        return AugmentResult(success=False)
-
-    target.attack_range += bonus_range
-    target._fires_missiles = True
-    return AugmentResult(success=True, affected_champions=[target.name])
+        result = _EMPTY_FAIL
+    else:
+        target._bonus_attack_range = bonus_range
+        target._fires_missiles = True
+        result = AugmentResult(success=True, affected_champions=(target.name,))
+
+    player._passive_memo[AUGMENT_ID] = (memo_key, result)
+    return result
 
 
 HOOKS: Dict[str, Any] = {
@@ -84,7 +84,7 @@ def _passive(player: "Player", effects: Dict[str, Any]) -> AugmentResult:
             champ._shield = champ.max_hp * shield_pct
             shielded.append(champ.name)
 
-    return AugmentResult(success=True, affected_champions=shielded)
+    return AugmentResult(success=True, affected_champions=tuple(shielded))
 
 
 HOOKS: Dict[str, Any] = {
@@ -11,10 +11,13 @@ Adding a new augment:
 """
 from __future__ import annotations
 
-from typing import Any, Dict, FrozenSet, List, Optional, TYPE_CHECKING
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 from data_loader.data_models import Augment
-from simulator.env.augment_effects._base import AugmentResult
+from simulator.env.augment_effects._base import AugmentResult, _EMPTY_OK
 
 # --- Import every augment module ---
 from simulator.env.augment_effects import artillery_barrage
@@ -39,10 +42,14 @@ _AUGMENT_MODULES = [
 ]
 
 # AUGMENT_REGISTRY  maps  augment_id -> {event_name -> hook_fn}
-AUGMENT_REGISTRY: Dict[str, Dict[str, Any]] = {
+# Exposed as a read-only view: the hot path dispatches through
+# _HOOK_TABLE (derived below at import), so a mutation of the public
+# registry would silently desync the two — the proxy makes that loud.
+_REGISTRY_DICT: Dict[str, Dict[str, Any]] = {
     mod.AUGMENT_ID: mod.HOOKS
     for mod in _AUGMENT_MODULES
 }
+AUGMENT_REGISTRY = MappingProxyType(_REGISTRY_DICT)
 
 # SYNTHETIC_AUGMENTS  — Augment objects for augments absent from the JSON data.
 SYNTHETIC_AUGMENTS: List[Augment] = [
@@ -59,6 +66,42 @@ AUGMENT_ELIGIBLE_ROUNDS: Dict[str, FrozenSet[int]] = {
     if mod.ELIGIBLE_ROUNDS is not None
 }
 
+class HookEvent(IntEnum):
+    """Augment lifecycle events, in _HOOK_TABLE tuple index order."""
+    ON_SELECT = 0
+    PASSIVE = 1
+    ON_STAGE_START = 2
+
+
+# String event name -> HookEvent, resolved once at the public boundary.
+_EVENT_INDEX: Dict[str, int] = {
+    "on_select": HookEvent.ON_SELECT,
+    "passive": HookEvent.PASSIVE,
+    "on_stage_start": HookEvent.ON_STAGE_START,
+}
+
+# Flattened hook lookup: interned augment_id -> 3-slot tuple indexed by
+# HookEvent (None = event unused).  Derived from AUGMENT_REGISTRY at
+# import so the hot dispatch path is one dict probe on an interned key
+# plus a tuple index.
+_HOOK_TABLE: Dict[str, Tuple[Optional[Any], ...]] = {
+    sys.intern(aug_id): (
+        hooks.get("on_select"),
+        hooks.get("passive"),
+        hooks.get("on_stage_start"),
+    )
+    for aug_id, hooks in AUGMENT_REGISTRY.items()
+}
+
+# Memoized eligibility lists keyed by (round_number, id(data_augments)).
+# Each entry pins the keyed list so its id cannot be recycled while the
+# entry lives; a hit additionally verifies identity.  Callers must pass
+# a stable list (the event engine keeps one per reset), and the cache is
+# cleared at a small cap so long training runs with many resets do not
+# accumulate entries for dead lists.
+_ELIGIBLE_CACHE: Dict[tuple, Tuple[List[Augment], List[Augment]]] = {}
+_ELIGIBLE_CACHE_MAX = 64
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -67,7 +110,7 @@ AUGMENT_ELIGIBLE_ROUNDS: Dict[str, FrozenSet[int]] = {
 def apply_augment_hook(
     player: "Player",
     augment: Augment,
-    event: str,
+    event: HookEvent,
 ) -> AugmentResult:
     """
     Fire a lifecycle hook for a single augment.
@@ -75,24 +118,42 @@ def apply_augment_hook(
     Args:
         player:  The player who owns this augment.
         augment: The Augment data object.
-        event:   One of "on_select", "passive", "on_stage_start".
+        event:   A HookEvent member (ON_SELECT, PASSIVE, ON_STAGE_START).
 
     Returns:
         AugmentResult describing what happened.
-        Returns AugmentResult(success=True) when the augment is not
-        implemented or the event has no registered hook — safe to ignore.
+        Returns a shared success no-op result when the augment is not
+        implemented or the event has no registered hook — safe to ignore,
+        but do not mutate it.
     """
-    handler = AUGMENT_REGISTRY.get(augment.augment_id)
-    if handler is None:
-        return AugmentResult(success=True)   # not implemented — silent no-op
+    hooks = _HOOK_TABLE.get(augment.augment_id)
+    if hooks is None:
+        return _EMPTY_OK   # not implemented — silent no-op
 
-    hook = handler.get(event)
+    hook = hooks[event]
     if hook is None:
-        return AugmentResult(success=True)   # event not used by this augment
+        return _EMPTY_OK   # event not used by this augment
 
     return hook(player, augment.effects)
 
 
+def apply_augment_hook_by_name(
+    player: "Player",
+    augment: Augment,
+    event: str,
+) -> AugmentResult:
+    """
+    String-keyed wrapper around apply_augment_hook.
+
+    Kept for callers that carry the event name as data (e.g. config or
+    logs); code that knows the event statically should pass a HookEvent.
+    """
+    event_idx = _EVENT_INDEX.get(event)
+    if event_idx is None:
+        return _EMPTY_OK   # unknown event name — no-op
+    return apply_augment_hook(player, augment, event_idx)
+
+
 def apply_all_passives(player: "Player") -> None:
     """
     Re-apply passive bonuses for every augment the player holds.
@@ -100,8 +161,23 @@ def apply_all_passives(player: "Player") -> None:
     Call this at the start of each combat phase, after board changes
     and before combat.py reads champion stats.
     """
-    for augment in player.selected_augments:
-        apply_augment_hook(player, augment, "passive")
+    # Player resolves (hook, effects) pairs once in select_augment, so the
+    # per-combat loop is pure dispatch — no table lookups or no-op results.
+    for hook, effects in player._passive_plan:
+        hook(player, effects)
+
+
+def apply_all_passives_for_players(players: List["Player"]) -> None:
+    """
+    Apply passive bonuses for every player in one call.
+
+    Convenience batch wrapper for phase code that already has the alive
+    list; each player still runs its own resolved plan, so hook order
+    per player is identical to apply_all_passives.
+    """
+    for player in players:
+        for hook, effects in player._passive_plan:
+            hook(player, effects)
 
 
 def apply_all_stage_start_hooks(player: "Player") -> None:
@@ -110,8 +186,15 @@ def apply_all_stage_start_hooks(player: "Player") -> None:
 
     Call this in the event engine whenever the stage number increases.
     """
-    for augment in player.selected_augments:
-        apply_augment_hook(player, augment, "on_stage_start")
+    for hook, effects in player._stage_start_plan:
+        hook(player, effects)
+
+
+def apply_all_stage_start_hooks_for_players(players: List["Player"]) -> None:
+    """Fire on_stage_start hooks for every player in one call."""
+    for player in players:
+        for hook, effects in player._stage_start_plan:
+            hook(player, effects)
 
 
 def get_eligible_augments(
@@ -135,8 +218,15 @@ def get_eligible_augments(
         data_augments: Augments loaded from the JSON data file.
 
     Returns:
-        List of eligible Augment objects for this round.
+        List of eligible Augment objects for this round.  The list is
+        cached per (round, augment-list identity) — treat it as
+        read-only; replace (don't mutate) data_augments to invalidate.
     """
+    cache_key = (round_number, id(data_augments))
+    cached = _ELIGIBLE_CACHE.get(cache_key)
+    if cached is not None and cached[0] is data_augments:
+        return cached[1]
+
     seen: set = set()
     candidates: List[Augment] = []
 
@@ -156,4 +246,7 @@ def get_eligible_augments(
         if restriction is None or round_number in restriction:
             eligible.append(aug)
 
+    if len(_ELIGIBLE_CACHE) >= _ELIGIBLE_CACHE_MAX:
+        _ELIGIBLE_CACHE.clear()
+    _ELIGIBLE_CACHE[cache_key] = (data_augments, eligible)
     return eligible
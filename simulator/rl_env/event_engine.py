@@ -17,8 +17,13 @@ import heapq
 import random
 from enum import Enum, auto
 
+from data_loader import TFTDataLoader
 from simulator.core.player import Player
 from simulator.core.pool import ChampionPool
+from simulator.env.augment_effects import (
+    apply_all_stage_start_hooks_for_players,
+    get_eligible_augments,
+)
 from simulator.engine.combat import CombatSimulator
 from simulator.engine.game_round import GameRound
 from simulator.config import TFTConfig, GameConstants
@@ -212,6 +217,11 @@ class TFTEventEngine(EventEngine):
         self.combat_sim: Optional[CombatSimulator] = None
         self.game_round: Optional[GameRound] = None
 
+        # Loader augments as a stable list, rebuilt once per reset().
+        # get_eligible_augments memoizes on this list's identity, so the
+        # same object must be passed on every selection event.
+        self._data_augments: List[Any] = []
+
         # Game state
         self.current_round: int = 0
         self.current_stage: int = 1
@@ -241,11 +251,11 @@ class TFTEventEngine(EventEngine):
         """
         self.clear_queue()
 
-        from data_loader import TFTDataLoader
         data_loader = TFTDataLoader()
 
         self.pool = ChampionPool(data_loader=data_loader)
         self.combat_sim = CombatSimulator(self.config)
+        self._data_augments = list(data_loader.augments.values())
 
         self.players = [
             Player(
@@ -302,10 +312,9 @@ class TFTEventEngine(EventEngine):
 
         # Fire on_stage_start hooks when stage changes
         if is_new_stage:
-            from simulator.env.augment_effects import apply_all_stage_start_hooks
-            for player in self.players:
-                if player.is_alive:
-                    apply_all_stage_start_hooks(player)
+            apply_all_stage_start_hooks_for_players(
+                [p for p in self.players if p.is_alive]
+            )
 
         round_type = self.game_round.get_round_type(self.current_round)
 
@@ -468,10 +477,7 @@ class TFTEventEngine(EventEngine):
         For MVP: each alive player auto-selects a random augment from 3 offered.
         Fires the augment's on_select hook immediately.
         """
-        from simulator.env.augment_effects import get_eligible_augments
-
-        data_augments = list(self.pool.data_loader.augments.values()) if self.pool else []
-        eligible = get_eligible_augments(self.current_round, data_augments)
+        eligible = get_eligible_augments(self.current_round, self._data_augments)
 
         for player in self.players:
             if not player.is_alive: